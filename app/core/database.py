@@ -1,3 +1,5 @@
+from contextvars import ContextVar
+from typing import Optional
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
@@ -21,8 +23,18 @@ AsyncSessionLocal = async_sessionmaker(
 
 Base = declarative_base()
 
+# Session to hand out instead of opening a new one (set by the test suite)
+session_override: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "session_override", default=None
+)
+
 # Dependency for FastAPI
 async def get_db():
+    override = session_override.get()
+    if override is not None:
+        yield override
+        return
+
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -4,6 +4,10 @@ from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from app.core.config import settings
 
+# PBKDF2 work factor. Stored hashes don't record it, so changing it
+# invalidates existing passwords (the test suite lowers it for speed)
+PBKDF2_ITERATIONS = 100000
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     # Hash format: salt$hash
@@ -13,7 +17,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
             'sha256',
             plain_password.encode('utf-8'),
             salt.encode('utf-8'),
-            100000
+            PBKDF2_ITERATIONS
         ).hex()
         return password_hash == stored_hash
     except:
@@ -26,7 +30,7 @@ def get_password_hash(password: str) -> str:
         'sha256',
         password.encode('utf-8'),
         salt.encode('utf-8'),
-        100000
+        PBKDF2_ITERATIONS
     ).hex()
     return f"{salt}${password_hash}"
 
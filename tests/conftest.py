@@ -20,24 +20,41 @@ env_test_path = project_root / ".env.test"
 # Load .env.test file
 load_dotenv(env_test_path, override=True)
 
+import logging
 import pytest
-import asyncio
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+)
 from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import make_url
 from httpx import AsyncClient, ASGITransport
-from datetime import datetime, timedelta
-import secrets
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import base64
+from types import SimpleNamespace
 import random
+import psycopg2
+import uvloop
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import session_override
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core import security
+from app.core.security import create_access_token, get_password_hash
 from app.models.admin_user import AdminUser
+from app.models.admission_data import AdmissionData
+from app.models.display_settings import DisplaySettings
 from app.models.institution import Institution
 from app.models.scholarship import Scholarship
+from app.models.tuition_data import TuitionData
 from app.models.invitation_code import InvitationCode, InvitationStatus
+from tests.factories import SCHOLARSHIP_DEFAULTS
+
+logger = logging.getLogger(__name__)
 
 # Test database URL
 TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
@@ -48,7 +65,19 @@ if not TEST_DATABASE_URL:
         base_url = base_url.replace("postgresql://", "postgresql+asyncpg://")
     TEST_DATABASE_URL = base_url.replace("campusconnect_db", "unified_test")
 
-print(f"\n🔧 Test Database URL: {TEST_DATABASE_URL.split('@')[0]}@...")
+# Under pytest-xdist every worker gets its own copy of the test database,
+# cloned from the configured one, so workers never share rows
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+TEMPLATE_DATABASE = make_url(TEST_DATABASE_URL).database
+
+if XDIST_WORKER:
+    TEST_DATABASE_URL = (
+        make_url(TEST_DATABASE_URL)
+        .set(database=f"{TEMPLATE_DATABASE}_{XDIST_WORKER}")
+        .render_as_string(hide_password=False)
+    )
+
+logger.debug("Test database URL: %s@...", TEST_DATABASE_URL.split("@")[0])
 
 # Test engine
 test_engine = create_async_engine(
@@ -58,12 +87,38 @@ test_engine = create_async_engine(
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for the test session"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def _maintenance_connection():
+    """Autocommit psycopg2 connection to the 'postgres' maintenance database"""
+    url = make_url(TEST_DATABASE_URL).set(drivername="postgresql", database="postgres")
+    conn = psycopg2.connect(url.render_as_string(hide_password=False))
+    conn.autocommit = True
+    return conn
+
+
+def create_worker_database():
+    """Clone the test database for this xdist worker if it doesn't exist yet"""
+    worker_db = make_url(TEST_DATABASE_URL).database
+    conn = _maintenance_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (worker_db,))
+            if cur.fetchone() is None:
+                cur.execute(
+                    f'CREATE DATABASE "{worker_db}" TEMPLATE "{TEMPLATE_DATABASE}"'
+                )
+    finally:
+        conn.close()
+
+
+def drop_worker_database():
+    """Drop this xdist worker's database"""
+    worker_db = make_url(TEST_DATABASE_URL).database
+    conn = _maintenance_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f'DROP DATABASE IF EXISTS "{worker_db}"')
+    finally:
+        conn.close()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -72,63 +127,169 @@ async def setup_test_database():
     Since unified_test was created from unified_db template,
     it already has all tables. Just verify connection.
     """
-    print("\n🔧 Verifying test database connection...")
+    logger.debug("Verifying test database connection")
 
     async with test_engine.connect() as conn:
         result = await conn.execute(text("SELECT 1"))
-        print("✅ Test database connection verified")
+        logger.debug("Test database connection verified")
 
     yield
 
-    print("\n🧹 Test session complete")
+    logger.debug("Test session complete")
     await test_engine.dispose()
 
 
-@pytest.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+@pytest.fixture(scope="session")
+def event_loop_policy() -> uvloop.EventLoopPolicy:
+    """Run the test session's event loop on uvloop, as the app does under uvicorn"""
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Cheap PBKDF2 for the whole run; password hashing strength isn't under test"""
+    original = security.PBKDF2_ITERATIONS
+    security.PBKDF2_ITERATIONS = 1000
+    yield
+    security.PBKDF2_ITERATIONS = original
+
+
+@pytest.fixture(scope="session")
+async def db_connection(setup_test_database) -> AsyncGenerator[AsyncConnection, None]:
     """
-    Fresh database session for each test with automatic rollback.
-    Each test gets a clean slate.
+    One connection for the whole run. Everything happens inside its outer
+    transaction, which is rolled back at the end, so nothing is committed.
     """
-    connection = await test_engine.connect()
-    transaction = await connection.begin()
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        yield connection
+        await transaction.rollback()
 
-    async_session = async_sessionmaker(
-        bind=connection,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
 
-    async with async_session() as session:
-        yield session
-        await transaction.rollback()
+# Session commits/rollbacks only release/roll back a SAVEPOINT of their own
+SavepointSession = async_sessionmaker(
+    class_=AsyncSession,
+    expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
+)
+
 
-    await connection.close()
+@pytest.fixture(scope="session")
+async def seed_session(
+    db_connection: AsyncConnection,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session used by the session-scoped fixtures. Their rows live in the outer
+    transaction, so every test sees them and the final rollback removes them.
+    """
+    async with SavepointSession(bind=db_connection) as session:
+        yield session
 
 
 @pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Test client with database session override"""
+async def db_session(
+    db_connection: AsyncConnection,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Fresh database session for each test, wrapped in a SAVEPOINT that is
+    rolled back afterwards. Each test gets a clean slate.
+    """
+    savepoint = await db_connection.begin_nested()
+
+    async with SavepointSession(bind=db_connection) as session:
+        yield session
 
-    async def override_get_db():
-        yield db_session
+    if savepoint.is_active:
+        await savepoint.rollback()
 
-    app.dependency_overrides[get_db] = override_get_db
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    """The one ASGI transport (and app instance) every test client goes through"""
+    return ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session")
+async def http_client(
+    asgi_transport: ASGITransport,
+) -> AsyncGenerator[AsyncClient, None]:
+    """One AsyncClient shared by the whole session"""
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
         yield ac
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture
+async def client(
+    http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Shared test client with this test's database session override.
+    Every request in a test runs on that one session, so await requests
+    one at a time instead of gathering them.
+    """
+    token = session_override.set(db_session)
+    try:
+        yield http_client
+    finally:
+        session_override.reset(token)
+
+
+async def seed_request(
+    http_client: AsyncClient,
+    seed_session: AsyncSession,
+    method: str,
+    url: str,
+    **kwargs,
+):
+    """Request made by a session-scoped fixture, run on seed_session"""
+    token = session_override.set(seed_session)
+    try:
+        return await http_client.request(method, url, **kwargs)
+    finally:
+        session_override.reset(token)
 
 
 # === FIXTURES - Use random IDs to avoid conflicts ===
 
 
-@pytest.fixture
-async def super_admin_user(db_session: AsyncSession) -> AdminUser:
-    """Create a Super Admin user with unique email"""
-    email = f"admin_{random.randint(1000, 9999)}@campusconnect.com"
+def utcnow() -> datetime:
+    """Current UTC time, timezone-naive to match the TIMESTAMP columns"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def persist(session: AsyncSession, *objs) -> None:
+    """
+    Insert objects with a single flush. On PostgreSQL the INSERT ... RETURNING
+    already loads primary keys and server defaults, so no refresh is needed.
+    """
+    session.add_all(objs)
+    await session.flush()
+
+
+@pytest.fixture(scope="session")
+def rng() -> random.Random:
+    """
+    Fixed-seed RNG for generated test data, so every run creates the same
+    emails, IPEDS IDs and invitation codes
+    """
+    return random.Random(0xC4FE)
+
+
+def _token(rng: random.Random) -> str:
+    """URL-safe 16-character code, like secrets.token_urlsafe(12)"""
+    return base64.urlsafe_b64encode(rng.randbytes(12)).decode()
+
+
+@pytest.fixture(scope="session")
+def invitation_expires_at() -> datetime:
+    """Expiry shared by all invitation fixtures (30 days out)"""
+    return utcnow() + timedelta(days=30)
+
+
+@pytest.fixture(scope="session")
+async def super_admin_user(seed_session: AsyncSession, rng: random.Random) -> AdminUser:
+    """Create a Super Admin user with unique email (once per session)"""
+    email = f"admin_{rng.randint(1000, 9999)}@campusconnect.com"
     super_admin = AdminUser(
         email=email,
         hashed_password=get_password_hash("SuperAdmin123!"),
@@ -136,35 +297,51 @@ async def super_admin_user(db_session: AsyncSession) -> AdminUser:
         entity_id=None,
         role="super_admin",
         is_active=True,
-        created_at=datetime.utcnow(),
+        created_at=utcnow(),
     )
-    db_session.add(super_admin)
-    await db_session.flush()
-    await db_session.refresh(super_admin)
+    await persist(seed_session, super_admin)
+    await seed_session.commit()
     return super_admin
 
 
-@pytest.fixture
-async def super_admin_token(client: AsyncClient, super_admin_user: AdminUser) -> str:
-    """Get Super Admin JWT token"""
-    response = await client.post(
-        "/api/v1/admin/auth/login",
-        data={"username": super_admin_user.email, "password": "SuperAdmin123!"},
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+@pytest.fixture(scope="session")
+def super_admin_token(super_admin_user: AdminUser) -> str:
+    """Super Admin JWT, minted once per session without a /login round trip"""
+    return create_access_token(data={"sub": super_admin_user.email})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def super_admin_headers(super_admin_token: str) -> dict:
     """Authorization headers for Super Admin"""
     return {"Authorization": f"Bearer {super_admin_token}"}
 
 
-@pytest.fixture
-async def test_institution(db_session: AsyncSession) -> Institution:
-    """Create a test institution with unique IPEDS ID"""
-    ipeds_id = random.randint(100000, 999999)
+@pytest.fixture(scope="session")
+async def super_admin_me(
+    http_client: AsyncClient, seed_session: AsyncSession, super_admin_headers: dict
+) -> dict:
+    """Super Admin's /auth/me response, fetched once per session"""
+    response = await seed_request(
+        http_client,
+        seed_session,
+        "GET",
+        "/api/v1/admin/auth/me",
+        headers=super_admin_headers,
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+async def test_institution(
+    seed_session: AsyncSession, rng: random.Random
+) -> Institution:
+    """
+    Create a test institution with unique IPEDS ID (once per session).
+    Shared by every test, so don't modify this object; load the row through
+    db_session instead, so the change is rolled back with the test.
+    """
+    ipeds_id = rng.randint(100000, 999999)
     institution = Institution(
         ipeds_id=ipeds_id,
         name=f"Test University {ipeds_id}",
@@ -175,17 +352,144 @@ async def test_institution(db_session: AsyncSession) -> Institution:
         size_category="Medium",
         locale="City",
     )
-    db_session.add(institution)
-    await db_session.flush()
-    await db_session.refresh(institution)
+    await persist(seed_session, institution)
+    await seed_session.commit()
+    return institution
+
+
+@pytest.fixture
+async def seeded_admission(
+    db_session: AsyncSession, test_institution: Institution
+) -> AdmissionData:
+    """Admissions row for the test institution, rolled back per test"""
+    admission = AdmissionData(
+        institution_id=test_institution.id,
+        ipeds_id=test_institution.ipeds_id,
+        academic_year="2023-24",
+        acceptance_rate=45.0,
+    )
+    await persist(db_session, admission)
+    return admission
+
+
+@pytest.fixture
+async def seeded_tuition(
+    db_session: AsyncSession, test_institution: Institution
+) -> TuitionData:
+    """Tuition row for the test institution, rolled back per test"""
+    tuition = TuitionData(
+        institution_id=test_institution.id,
+        ipeds_id=test_institution.ipeds_id,
+        academic_year="2023-24",
+        tuition_in_state=10000,
+        tuition_out_state=30000,
+    )
+    await persist(db_session, tuition)
+    return tuition
+
+
+@pytest.fixture
+async def seeded_display_settings(
+    db_session: AsyncSession, test_institution: Institution
+) -> DisplaySettings:
+    """Display settings row for the test institution, rolled back per test"""
+    settings_row = DisplaySettings(
+        entity_type="institution",
+        entity_id=test_institution.id,
+        layout_style="standard",
+    )
+    await persist(db_session, settings_row)
+    return settings_row
+
+
+@pytest.fixture(scope="session")
+async def featured_institution(
+    seed_session: AsyncSession, rng: random.Random
+) -> Institution:
+    """
+    Featured institution scoring above the featured list's 70 threshold,
+    created once per session. Kept separate from test_institution so the
+    shared institution stays unfeatured.
+    """
+    ipeds_id = rng.randint(100000, 999999)
+    institution = Institution(
+        ipeds_id=ipeds_id,
+        name=f"Featured University {ipeds_id}",
+        city="Boston",
+        state="MA",
+        control_type="PUBLIC",
+        student_faculty_ratio=15.0,
+        size_category="Medium",
+        locale="City",
+        is_featured=True,
+        data_completeness_score=75,
+    )
+    await persist(seed_session, institution)
+    await seed_session.commit()
     return institution
 
 
+IPEDS_CORPUS_SIZE = 1000
+_IPEDS_CORPUS_STATES = ("MA", "CA", "NY", "TX", "OH")
+
+
+@pytest.fixture(scope="module")
+async def ipeds_corpus(
+    db_connection: AsyncConnection,
+    test_institution: Institution,
+    featured_institution: Institution,
+) -> AsyncGenerator[int, None]:
+    """
+    Load IPEDS_CORPUS_SIZE deterministic institutions with a single COPY
+    inside a SAVEPOINT that is rolled back when the module finishes, so only
+    the filtered-search tests see them. IPEDS IDs start at 1,000,000, above
+    the range the other fixtures draw from. Completeness scores cycle through
+    0-100 and every other row has tuition.
+
+    The session-scoped institutions these tests use are requested here so
+    they exist before the SAVEPOINT opens; created inside it, they would be
+    rolled back with the corpus.
+    """
+    columns = (
+        "ipeds_id",
+        "name",
+        "city",
+        "state",
+        "control_type",
+        "data_completeness_score",
+        "tuition_in_state",
+        "tuition_out_of_state",
+    )
+    records = [
+        (
+            1_000_000 + i,
+            f"Corpus College {i:04d}",
+            "Springfield",
+            _IPEDS_CORPUS_STATES[i % len(_IPEDS_CORPUS_STATES)],
+            "PUBLIC",
+            i % 101,
+            Decimal(8000 + i) if i % 2 == 0 else None,
+            Decimal(24000 + i) if i % 2 == 0 else None,
+        )
+        for i in range(IPEDS_CORPUS_SIZE)
+    ]
+
+    savepoint = await db_connection.begin_nested()
+    raw = await db_connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "institutions", records=records, columns=columns
+    )
+    yield IPEDS_CORPUS_SIZE
+
+    if savepoint.is_active:
+        await savepoint.rollback()
+
+
 @pytest.fixture
-async def test_scholarship(db_session: AsyncSession) -> Scholarship:
+async def test_scholarship(db_session: AsyncSession, rng: random.Random) -> Scholarship:
     """Create a test scholarship - use valid enum values"""
     scholarship = Scholarship(
-        title=f"Test Scholarship {random.randint(1000, 9999)}",
+        title=f"Test Scholarship {rng.randint(1000, 9999)}",
         organization="Test Organization",
         scholarship_type="ACADEMIC_MERIT",  # Valid enum value
         status="ACTIVE",
@@ -195,68 +499,157 @@ async def test_scholarship(db_session: AsyncSession) -> Scholarship:
         is_renewable=True,
         min_gpa=3.0,
     )
-    db_session.add(scholarship)
-    await db_session.flush()
-    await db_session.refresh(scholarship)
+    await persist(db_session, scholarship)
     return scholarship
 
 
 @pytest.fixture
-async def invitation_code_institution(
-    db_session: AsyncSession, test_institution: Institution, super_admin_user: AdminUser
+def make_scholarship(db_session: AsyncSession):
+    """Factory that inserts a Scholarship through the ORM, skipping the API"""
+
+    async def _make(**overrides) -> Scholarship:
+        scholarship = Scholarship(**{**SCHOLARSHIP_DEFAULTS, **overrides})
+        await persist(db_session, scholarship)
+        return scholarship
+
+    return _make
+
+
+# NOT NULL scholarship columns whose defaults live in the model, not the
+# database, so COPY has to send them explicitly
+_SCHOLARSHIP_COPY_DEFAULTS = {
+    "status": "ACTIVE",
+    "difficulty_level": "MODERATE",
+    "is_renewable": False,
+    "verified": False,
+    "featured": False,
+    "views_count": 0,
+    "applications_count": 0,
+}
+
+
+@pytest.fixture
+def bulk_seed_scholarships(db_session: AsyncSession):
+    """
+    Factory that inserts many scholarships with a single COPY
+    (asyncpg copy_records_to_table) on the test's connection.
+    """
+
+    async def _seed(rows: list) -> None:
+        rows = [
+            {**SCHOLARSHIP_DEFAULTS, **_SCHOLARSHIP_COPY_DEFAULTS, **row}
+            for row in rows
+        ]
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        records = [tuple(row.get(column) for column in columns) for row in rows]
+
+        connection = await db_session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "scholarships", records=records, columns=columns
+        )
+
+    return _seed
+
+
+def _institution_invitation(
+    institution: Institution,
+    created_by: AdminUser,
+    expires_at: datetime,
+    rng: random.Random,
 ) -> InvitationCode:
-    """Create invitation code for institution"""
-    invitation = InvitationCode(
-        code=secrets.token_urlsafe(12),
+    """Pending invitation code for an institution"""
+    return InvitationCode(
+        code=_token(rng),
         entity_type="institution",
-        entity_id=test_institution.id,
-        assigned_email=f"testadmin_{random.randint(1000, 9999)}@institution.com",
+        entity_id=institution.id,
+        assigned_email=f"testadmin_{rng.randint(1000, 9999)}@institution.com",
         status=InvitationStatus.PENDING,
-        expires_at=datetime.utcnow() + timedelta(days=30),
-        created_by=super_admin_user.email,
-        created_at=datetime.utcnow(),
+        expires_at=expires_at,
+        created_by=created_by.email,
+        created_at=utcnow(),
+    )
+
+
+@pytest.fixture(scope="session")
+async def invitation_code_institution_claimed(
+    seed_session: AsyncSession,
+    test_institution: Institution,
+    super_admin_user: AdminUser,
+    invitation_expires_at: datetime,
+    rng: random.Random,
+) -> InvitationCode:
+    """
+    Invitation code for the test institution, created once per session and
+    claimed by registered_admin_user (request both to rely on that). Use
+    invitation_code_institution_fresh for tests that need a pending code.
+    """
+    invitation = _institution_invitation(
+        test_institution, super_admin_user, invitation_expires_at, rng
+    )
+    await persist(seed_session, invitation)
+    await seed_session.commit()
+    return invitation
+
+
+@pytest.fixture
+async def invitation_code_institution_fresh(
+    db_session: AsyncSession,
+    test_institution: Institution,
+    super_admin_user: AdminUser,
+    invitation_expires_at: datetime,
+    rng: random.Random,
+) -> InvitationCode:
+    """Pending invitation code for the test institution, rolled back per test"""
+    invitation = _institution_invitation(
+        test_institution, super_admin_user, invitation_expires_at, rng
     )
-    db_session.add(invitation)
-    await db_session.flush()
-    await db_session.refresh(invitation)
+    await persist(db_session, invitation)
     return invitation
 
 
 @pytest.fixture
 async def invitation_code_scholarship(
-    db_session: AsyncSession, test_scholarship: Scholarship, super_admin_user: AdminUser
+    db_session: AsyncSession,
+    test_scholarship: Scholarship,
+    super_admin_user: AdminUser,
+    invitation_expires_at: datetime,
+    rng: random.Random,
 ) -> InvitationCode:
     """Create invitation code for scholarship"""
     invitation = InvitationCode(
-        code=secrets.token_urlsafe(12),
+        code=_token(rng),
         entity_type="scholarship",
         entity_id=test_scholarship.id,
-        assigned_email=f"testadmin_{random.randint(1000, 9999)}@scholarship.com",
+        assigned_email=f"testadmin_{rng.randint(1000, 9999)}@scholarship.com",
         status=InvitationStatus.PENDING,
-        expires_at=datetime.utcnow() + timedelta(days=30),
+        expires_at=invitation_expires_at,
         created_by=super_admin_user.email,
-        created_at=datetime.utcnow(),
+        created_at=utcnow(),
     )
-    db_session.add(invitation)
-    await db_session.flush()
-    await db_session.refresh(invitation)
+    await persist(db_session, invitation)
     return invitation
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def registered_admin_user(
-    client: AsyncClient, invitation_code_institution: InvitationCode
+    http_client: AsyncClient,
+    seed_session: AsyncSession,
+    invitation_code_institution_claimed: InvitationCode,
 ) -> dict:
-    """Register an admin user and return credentials"""
-    email = invitation_code_institution.assigned_email
+    """Register an admin user once per session and return credentials"""
+    email = invitation_code_institution_claimed.assigned_email
     password = "TestPassword123!"
 
-    response = await client.post(
+    response = await seed_request(
+        http_client,
+        seed_session,
+        "POST",
         "/api/v1/admin/auth/register",
         json={
             "email": email,
             "password": password,
-            "invitation_code": invitation_code_institution.code,
+            "invitation_code": invitation_code_institution_claimed.code,
         },
     )
 
@@ -265,40 +658,130 @@ async def registered_admin_user(
     return {"email": email, "password": password, "user_data": response.json()}
 
 
-@pytest.fixture
-async def admin_token(client: AsyncClient, registered_admin_user: dict) -> str:
-    """Get admin user JWT token"""
-    response = await client.post(
-        "/api/v1/admin/auth/login",
-        data={
-            "username": registered_admin_user["email"],
-            "password": registered_admin_user["password"],
-        },
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+@pytest.fixture(scope="session")
+def admin_token(registered_admin_user: dict) -> str:
+    """Admin user JWT, minted once per session without a /login round trip"""
+    return create_access_token(data={"sub": registered_admin_user["email"]})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def admin_headers(admin_token: str) -> dict:
     """Authorization headers for admin user"""
     return {"Authorization": f"Bearer {admin_token}"}
 
 
-# === IMAGE TESTING FIXTURES ===
+@pytest.fixture(scope="session")
+def admin_session(
+    registered_admin_user: dict,
+    admin_token: str,
+    admin_headers: dict,
+    invitation_code_institution_claimed: InvitationCode,
+) -> SimpleNamespace:
+    """Outputs of the session's one admin registration: email, token, headers
+    and the invitation it claimed"""
+    return SimpleNamespace(
+        email=registered_admin_user["email"],
+        token=admin_token,
+        headers=admin_headers,
+        invitation=invitation_code_institution_claimed,
+    )
+
+
+@pytest.fixture(scope="session")
+async def admin_entity(
+    http_client: AsyncClient, seed_session: AsyncSession, admin_headers: dict
+) -> dict:
+    """Admin's /profile/entity response, fetched once per session"""
+    response = await seed_request(
+        http_client,
+        seed_session,
+        "GET",
+        "/api/v1/admin/profile/entity",
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+async def admin_http_client(
+    asgi_transport: ASGITransport, admin_headers: dict
+) -> AsyncGenerator[AsyncClient, None]:
+    """Session-wide AsyncClient with the admin's Authorization header preset"""
+    async with AsyncClient(
+        transport=asgi_transport, base_url="http://test", headers=admin_headers
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture
+def admin_client(
+    client: AsyncClient, admin_http_client: AsyncClient
+) -> AsyncClient:
+    """
+    Admin-authenticated client. Depends on client so requests still run on
+    this test's database session.
+    """
+    return admin_http_client
 
 
 @pytest.fixture
+def admin_ctx(registered_admin_user: dict) -> SimpleNamespace:
+    """Registered admin's institution_id and email"""
+    user_data = registered_admin_user["user_data"]
+    return SimpleNamespace(
+        institution_id=user_data["entity_id"], email=user_data["email"]
+    )
+
+
+# === IMAGE TESTING FIXTURES ===
+
+
+@pytest.fixture(scope="session")
 def sample_image_bytes() -> bytes:
-    """Create a simple test image in memory"""
+    """1x1 test JPEG, encoded once per session"""
     from PIL import Image
     import io
 
-    img = Image.new("RGB", (800, 600), color="#2563eb")
+    img = Image.new("RGB", (1, 1), color="#2563eb")
     img_bytes = io.BytesIO()
-    img.save(img_bytes, format="JPEG")
-    img_bytes.seek(0)
-    return img_bytes.read()
+    img.save(img_bytes, format="JPEG", quality=1)
+    return img_bytes.getvalue()
+
+
+@pytest.fixture(scope="session")
+def spaces_available() -> bool:
+    """Whether the DigitalOcean Spaces bucket is reachable, probed once per session"""
+    import boto3
+    from botocore.client import Config
+
+    s3_client = boto3.client(
+        "s3",
+        endpoint_url=settings.DIGITAL_OCEAN_SPACES_ENDPOINT,
+        aws_access_key_id=settings.DIGITAL_OCEAN_SPACES_ACCESS_KEY,
+        aws_secret_access_key=settings.DIGITAL_OCEAN_SPACES_SECRET_KEY,
+        config=Config(
+            signature_version="s3v4",
+            connect_timeout=2,
+            read_timeout=2,
+            retries={"total_max_attempts": 1},
+        ),
+        region_name=settings.DIGITAL_OCEAN_SPACES_REGION,
+    )
+    try:
+        s3_client.head_bucket(Bucket=settings.DIGITAL_OCEAN_SPACES_BUCKET)
+    except Exception:
+        return False
+    return True
+
+
+@pytest.fixture(autouse=True)
+def skip_without_spaces(request: pytest.FixtureRequest) -> None:
+    """Skip tests marked spaces when the Spaces bucket is unreachable"""
+    if request.node.get_closest_marker("spaces") is None:
+        return
+    if not request.getfixturevalue("spaces_available"):
+        pytest.skip("Spaces not configured")
 
 
 @pytest.fixture
@@ -318,6 +801,10 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "invitation: Invitation code tests")
     config.addinivalue_line("markers", "super_admin: Super admin only tests")
 
+    # Per-request logging from these libraries is noise at test time
+    for name in ("sqlalchemy.engine", "httpx", "httpcore", "multipart", "asyncio"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
 
 @pytest.fixture(scope="session", autouse=True)
 async def setup_test_database():
@@ -325,10 +812,13 @@ async def setup_test_database():
     Clear test database data before tests.
     Schema should match unified_db (create manually if needed).
     """
-    print("\n🔧 Setting up test database...")
+    logger.debug("Setting up test database")
+
+    if XDIST_WORKER:
+        create_worker_database()
 
     # Clear all data from test database (keep schema)
-    print("🧹 Clearing test data while preserving schema...")
+    logger.debug("Clearing test data while preserving schema")
 
     async with test_engine.connect() as conn:
         # Get all table names
@@ -350,7 +840,7 @@ async def setup_test_database():
                 text(f"TRUNCATE TABLE {tables_str} RESTART IDENTITY CASCADE")
             )
             await conn.commit()
-            print(f"✅ Cleared {len(tables)} tables")
+            logger.debug("Cleared %d tables", len(tables))
 
     # Verify connection
     async with test_engine.connect() as conn:
@@ -360,9 +850,12 @@ async def setup_test_database():
             )
         )
         table_count = result.scalar()
-        print(f"✅ Test database has {table_count} tables")
+        logger.debug("Test database has %d tables", table_count)
 
     yield
 
-    print("\n🧹 Test session complete")
+    logger.debug("Test session complete")
     await test_engine.dispose()
+
+    if XDIST_WORKER:
+        drop_worker_database()
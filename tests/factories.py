@@ -0,0 +1,12 @@
+"""
+Plain test data shared by conftest fixtures and test modules
+"""
+
+# Minimal valid scholarship; make_scholarship overrides these per test
+SCHOLARSHIP_DEFAULTS = {
+    "title": "Test Scholarship",
+    "organization": "Test Org",
+    "scholarship_type": "STEM",
+    "amount_min": 1000,
+    "amount_max": 2000,
+}
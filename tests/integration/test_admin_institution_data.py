@@ -3,9 +3,17 @@ Integration tests for Admin Institution Data endpoints
 Tests the 7 new endpoints for institution admins to update their own data
 """
 
+import functools
+
 import pytest
 from httpx import AsyncClient
-from datetime import datetime
+
+
+@functools.lru_cache(maxsize=128)
+def _iurl(institution_id: int, kind: str = "") -> str:
+    """Admin institution-data URL for an institution and sub-resource"""
+    url = f"/api/v1/admin/institution-data/{institution_id}"
+    return f"{url}/{kind}" if kind else url
 
 
 @pytest.mark.integration
@@ -13,17 +21,13 @@ class TestAdminInstitutionData:
     """Test admin institution data management endpoints"""
 
     @pytest.mark.asyncio
-    async def test_get_institution_data(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_get_institution_data(self, admin_client: AsyncClient, admin_ctx):
         """Test GET /api/v1/admin/institution-data/{institution_id}"""
         # Get the institution_id from the registered admin
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id),
         )
 
         assert response.status_code == 200
@@ -38,29 +42,24 @@ class TestAdminInstitutionData:
 
     @pytest.mark.asyncio
     async def test_get_institution_data_wrong_institution(
-        self, client: AsyncClient, admin_headers: dict
+        self, admin_client: AsyncClient
     ):
         """Test that admin cannot access other institutions"""
         # Try to access a different institution (ID 99999)
-        response = await client.get(
+        response = await admin_client.get(
             "/api/v1/admin/institution-data/99999",
-            headers=admin_headers,
         )
 
         # Should be forbidden or not found
         assert response.status_code in [403, 404]
 
     @pytest.mark.asyncio
-    async def test_get_data_quality_report(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_get_data_quality_report(self, admin_client: AsyncClient, admin_ctx):
         """Test GET /api/v1/admin/institution-data/{institution_id}/quality"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/quality",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "quality"),
         )
 
         assert response.status_code == 200
@@ -82,19 +81,16 @@ class TestAdminInstitutionData:
         assert "has_room_board" in data
         assert "has_admissions_data" in data
 
-        # Verify types
-        assert isinstance(data["missing_fields"], list)
-        assert isinstance(data["verified_fields"], list)
-        assert isinstance(data["completeness_score"], int)
+        # Verify types (exact type, so a bool score doesn't pass as int)
+        assert type(data["missing_fields"]) is list
+        assert type(data["verified_fields"]) is list
+        assert type(data["completeness_score"]) is int
         assert 0 <= data["completeness_score"] <= 100
 
     @pytest.mark.asyncio
-    async def test_update_basic_info(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_update_basic_info(self, admin_client: AsyncClient, admin_ctx):
         """Test PUT /api/v1/admin/institution-data/{institution_id}/basic-info"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         update_data = {
             "website": "https://updated-university.edu",
@@ -102,9 +98,8 @@ class TestAdminInstitutionData:
             "size_category": "Large",
         }
 
-        response = await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/basic-info",
-            headers=admin_headers,
+        response = await admin_client.put(
+            _iurl(institution_id, "basic-info"),
             json=update_data,
         )
 
@@ -120,12 +115,9 @@ class TestAdminInstitutionData:
         assert data["data_source"] in ["admin", "mixed"]
 
     @pytest.mark.asyncio
-    async def test_update_cost_data(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_update_cost_data(self, admin_client: AsyncClient, admin_ctx):
         """Test PUT /api/v1/admin/institution-data/{institution_id}/cost-data"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         cost_updates = {
             "tuition_in_state": 12500.00,
@@ -135,9 +127,8 @@ class TestAdminInstitutionData:
             "application_fee_undergrad": 75.00,
         }
 
-        response = await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/cost-data",
-            headers=admin_headers,
+        response = await admin_client.put(
+            _iurl(institution_id, "cost-data"),
             json=cost_updates,
         )
 
@@ -157,12 +148,9 @@ class TestAdminInstitutionData:
         assert data["data_completeness_score"] > 0
 
     @pytest.mark.asyncio
-    async def test_update_admissions_data(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_update_admissions_data(self, admin_client: AsyncClient, admin_ctx):
         """Test PUT /api/v1/admin/institution-data/{institution_id}/admissions-data"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         admissions_updates = {
             "acceptance_rate": 65.5,
@@ -172,9 +160,8 @@ class TestAdminInstitutionData:
             "act_composite_75th": 29,
         }
 
-        response = await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/admissions-data",
-            headers=admin_headers,
+        response = await admin_client.put(
+            _iurl(institution_id, "admissions-data"),
             json=admissions_updates,
         )
 
@@ -192,21 +179,17 @@ class TestAdminInstitutionData:
         assert data["data_source"] in ["admin", "mixed"]
 
     @pytest.mark.asyncio
-    async def test_verify_current_data(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_verify_current_data(self, admin_client: AsyncClient, admin_ctx):
         """Test POST /api/v1/admin/institution-data/{institution_id}/verify-current"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         verify_request = {
             "academic_year": "2025-26",
             "notes": "Verified all costs are current for 2025-26 academic year",
         }
 
-        response = await client.post(
-            f"/api/v1/admin/institution-data/{institution_id}/verify-current",
-            headers=admin_headers,
+        response = await admin_client.post(
+            _iurl(institution_id, "verify-current"),
             json=verify_request,
         )
 
@@ -228,33 +211,29 @@ class TestAdminInstitutionData:
     @pytest.mark.asyncio
     async def test_get_verification_history(
         self,
-        client: AsyncClient,
-        admin_headers: dict,
-        registered_admin_user: dict,
+        admin_client: AsyncClient,
+        admin_ctx,
         db_session,
     ):
         """Test GET /api/v1/admin/institution-data/{institution_id}/verification-history"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # First, make some updates to create history
-        await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/cost-data",
-            headers=admin_headers,
+        await admin_client.put(
+            _iurl(institution_id, "cost-data"),
             json={"tuition_in_state": 15000.00},
         )
 
         # Now get the history
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/verification-history",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "verification-history"),
         )
 
         assert response.status_code == 200
         data = response.json()
 
         # Should be a list
-        assert isinstance(data, list)
+        assert type(data) is list
 
         # If we have history, verify structure
         if len(data) > 0:
@@ -270,21 +249,18 @@ class TestAdminInstitutionData:
     @pytest.mark.asyncio
     async def test_permission_denied_for_other_institution(
         self,
-        client: AsyncClient,
-        admin_headers: dict,
-        registered_admin_user: dict,
+        admin_client: AsyncClient,
+        admin_ctx,
         db_session,
     ):
         """Test that admin cannot update other institutions"""
-        user_data = registered_admin_user["user_data"]
-        admin_institution_id = user_data["entity_id"]
+        admin_institution_id = admin_ctx.institution_id
 
         # Try to update a DIFFERENT institution (use ID that's definitely not theirs)
         different_institution_id = admin_institution_id + 9999
 
-        response = await client.put(
-            f"/api/v1/admin/institution-data/{different_institution_id}/cost-data",
-            headers=admin_headers,
+        response = await admin_client.put(
+            _iurl(different_institution_id, "cost-data"),
             json={"tuition_in_state": 99999.00},
         )
 
@@ -297,17 +273,13 @@ class TestDataValidation:
     """Test data validation for admin updates"""
 
     @pytest.mark.asyncio
-    async def test_invalid_acceptance_rate(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_invalid_acceptance_rate(self, admin_client: AsyncClient, admin_ctx):
         """Test that acceptance rate must be 0-100"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # Try invalid acceptance rate (>100)
-        response = await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/admissions-data",
-            headers=admin_headers,
+        response = await admin_client.put(
+            _iurl(institution_id, "admissions-data"),
             json={"acceptance_rate": 150.0},  # Invalid!
         )
 
@@ -315,17 +287,13 @@ class TestDataValidation:
         assert response.status_code == 422
 
     @pytest.mark.asyncio
-    async def test_invalid_sat_score(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_invalid_sat_score(self, admin_client: AsyncClient, admin_ctx):
         """Test that SAT scores must be 200-800"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # Try invalid SAT score
-        response = await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/admissions-data",
-            headers=admin_headers,
+        response = await admin_client.put(
+            _iurl(institution_id, "admissions-data"),
             json={"sat_math_25th": 1000},  # Invalid! Max is 800
         )
 
@@ -333,17 +301,13 @@ class TestDataValidation:
         assert response.status_code == 422
 
     @pytest.mark.asyncio
-    async def test_negative_costs_rejected(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
-    ):
+    async def test_negative_costs_rejected(self, admin_client: AsyncClient, admin_ctx):
         """Test that negative costs are rejected"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # Try negative tuition
-        response = await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/cost-data",
-            headers=admin_headers,
+        response = await admin_client.put(
+            _iurl(institution_id, "cost-data"),
             json={"tuition_in_state": -5000.00},  # Invalid!
         )
 
@@ -357,30 +321,26 @@ class TestCompletenessScoreUpdates:
 
     @pytest.mark.asyncio
     async def test_completeness_increases_with_data(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
+        self, admin_client: AsyncClient, admin_ctx
     ):
         """Test that adding data increases completeness score"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # Get initial score
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/quality",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "quality"),
         )
         initial_score = response.json()["completeness_score"]
 
         # Add website
-        await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/basic-info",
-            headers=admin_headers,
+        await admin_client.put(
+            _iurl(institution_id, "basic-info"),
             json={"website": "https://test.edu"},
         )
 
         # Add cost data
-        await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/cost-data",
-            headers=admin_headers,
+        await admin_client.put(
+            _iurl(institution_id, "cost-data"),
             json={
                 "tuition_in_state": 10000.00,
                 "room_cost": 8000.00,
@@ -388,9 +348,8 @@ class TestCompletenessScoreUpdates:
         )
 
         # Get new score
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/quality",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "quality"),
         )
         new_score = response.json()["completeness_score"]
 
@@ -399,30 +358,26 @@ class TestCompletenessScoreUpdates:
 
     @pytest.mark.asyncio
     async def test_admin_verification_adds_bonus(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
+        self, admin_client: AsyncClient, admin_ctx
     ):
         """Test that admin verification adds 10 point bonus"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # Get score before verification
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/quality",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "quality"),
         )
         score_before = response.json()["completeness_score"]
 
         # Verify current data
-        await client.post(
-            f"/api/v1/admin/institution-data/{institution_id}/verify-current",
-            headers=admin_headers,
+        await admin_client.post(
+            _iurl(institution_id, "verify-current"),
             json={"academic_year": "2025-26"},
         )
 
         # Get score after verification
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/quality",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "quality"),
         )
         data = response.json()
         score_after = data["completeness_score"]
@@ -440,23 +395,20 @@ class TestVerificationHistory:
 
     @pytest.mark.asyncio
     async def test_updates_create_verification_records(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
+        self, admin_client: AsyncClient, admin_ctx
     ):
         """Test that updates create verification records"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # Make an update
-        await client.put(
-            f"/api/v1/admin/institution-data/{institution_id}/cost-data",
-            headers=admin_headers,
+        await admin_client.put(
+            _iurl(institution_id, "cost-data"),
             json={"tuition_in_state": 20000.00},
         )
 
         # Check verification history
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/verification-history",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "verification-history"),
         )
 
         assert response.status_code == 200
@@ -473,20 +425,19 @@ class TestVerificationHistory:
         if tuition_record:
             # Check that new value is 20000 (allow for different decimal formatting)
             assert float(tuition_record["new_value"]) == 20000.00
-            assert tuition_record["verified_by"] == user_data["email"]
+            assert tuition_record["verified_by"] == admin_ctx.email
 
     @pytest.mark.asyncio
     async def test_verification_history_limit(
-        self, client: AsyncClient, admin_headers: dict, registered_admin_user: dict
+        self, admin_client: AsyncClient, admin_ctx
     ):
         """Test that verification history respects limit parameter"""
-        user_data = registered_admin_user["user_data"]
-        institution_id = user_data["entity_id"]
+        institution_id = admin_ctx.institution_id
 
         # Get history with limit
-        response = await client.get(
-            f"/api/v1/admin/institution-data/{institution_id}/verification-history?limit=5",
-            headers=admin_headers,
+        response = await admin_client.get(
+            _iurl(institution_id, "verification-history"),
+            params={"limit": 5},
         )
 
         assert response.status_code == 200
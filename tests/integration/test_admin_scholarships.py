@@ -9,18 +9,29 @@ Tests cover:
 - Advanced search and filtering
 """
 
+from types import MappingProxyType
+
 import pytest
 from fastapi import status
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
+
+from app.models.scholarship import Scholarship
+from tests.factories import SCHOLARSHIP_DEFAULTS
+
+# Fields shared by most scholarships these tests create; spread and override
+BASE_SCHOLARSHIP = MappingProxyType(
+    {k: v for k, v in SCHOLARSHIP_DEFAULTS.items() if k != "title"}
+)
+
+# A deadline that has already passed, computed once at import
+PAST_DATE_30D = (date.today() - timedelta(days=30)).isoformat()
 
 
 class TestScholarshipCRUD:
     """Test create, read, update, delete operations for scholarships"""
 
-    async def test_create_scholarship(self, client, admin_token):
+    async def test_create_scholarship(self, admin_client):
         """Test creating a new scholarship with valid data"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         scholarship_data = {
             "title": "STEM Excellence Scholarship",
             "organization": "Tech Foundation",
@@ -41,10 +52,9 @@ class TestScholarshipCRUD:
             "featured": False
         }
         
-        response = await client.post(
+        response = await admin_client.post(
             "/api/v1/admin/scholarships",
-            json=scholarship_data,
-            headers=headers
+            json=scholarship_data
         )
         
         assert response.status_code == status.HTTP_201_CREATED
@@ -58,10 +68,8 @@ class TestScholarshipCRUD:
         assert "id" in data
         assert "created_at" in data
 
-    async def test_create_scholarship_invalid_amounts(self, client, admin_token):
+    async def test_create_scholarship_invalid_amounts(self, admin_client):
         """Test that creating a scholarship with amount_max < amount_min fails"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         scholarship_data = {
             "title": "Invalid Scholarship",
             "organization": "Test Org",
@@ -70,19 +78,16 @@ class TestScholarshipCRUD:
             "amount_max": 5000,
         }
         
-        response = await client.post(
+        response = await admin_client.post(
             "/api/v1/admin/scholarships",
-            json=scholarship_data,
-            headers=headers
+            json=scholarship_data
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "amount_max must be greater than or equal to amount_min" in response.json()["detail"]
 
-    async def test_create_scholarship_minimum_required_fields(self, client, admin_token):
+    async def test_create_scholarship_minimum_required_fields(self, admin_client):
         """Test creating a scholarship with only required fields"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         scholarship_data = {
             "title": "Minimal Scholarship",
             "organization": "Basic Org",
@@ -91,35 +96,25 @@ class TestScholarshipCRUD:
             "amount_max": 1000,
         }
         
-        response = await client.post(
+        response = await admin_client.post(
             "/api/v1/admin/scholarships",
-            json=scholarship_data,
-            headers=headers
+            json=scholarship_data
         )
         
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
         assert data["title"] == scholarship_data["title"]
 
-    async def test_update_scholarship(self, client, admin_token):
+    async def test_update_scholarship(self, admin_client, make_scholarship):
         """Test updating an existing scholarship"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # First create a scholarship
-        create_data = {
-            "title": "Original Title",
-            "organization": "Original Org",
-            "scholarship_type": "STEM",
-            "amount_min": 5000,
-            "amount_max": 10000,
-        }
-        
-        create_response = await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
+        scholarship = await make_scholarship(
+            title="Original Title",
+            organization="Original Org",
+            amount_min=5000,
+            amount_max=10000,
         )
-        scholarship_id = create_response.json()["id"]
+        scholarship_id = scholarship.id
         
         # Now update it
         update_data = {
@@ -129,10 +124,9 @@ class TestScholarshipCRUD:
             "description": "Updated description"
         }
         
-        response = await client.patch(
+        response = await admin_client.patch(
             f"/api/v1/admin/scholarships/{scholarship_id}",
-            json=update_data,
-            headers=headers
+            json=update_data
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -144,93 +138,60 @@ class TestScholarshipCRUD:
         assert data["description"] == update_data["description"]
         assert data["amount_min"] == 5000  # Unchanged
 
-    async def test_update_scholarship_invalid_amounts(self, client, admin_token):
+    async def test_update_scholarship_invalid_amounts(self, admin_client, make_scholarship):
         """Test that updating amounts with amount_max < amount_min fails"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create scholarship
-        create_data = {
-            "title": "Test Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 5000,
-            "amount_max": 10000,
-        }
-        
-        create_response = await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
+        scholarship = await make_scholarship(
+            title="Test Scholarship",
+            amount_min=5000,
+            amount_max=10000,
         )
-        scholarship_id = create_response.json()["id"]
+        scholarship_id = scholarship.id
         
         # Try to update with invalid amounts
         update_data = {
             "amount_min": 15000,  # Higher than current max of 10000
         }
         
-        response = await client.patch(
+        response = await admin_client.patch(
             f"/api/v1/admin/scholarships/{scholarship_id}",
-            json=update_data,
-            headers=headers
+            json=update_data
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    async def test_update_nonexistent_scholarship(self, client, admin_token):
+    async def test_update_nonexistent_scholarship(self, admin_client):
         """Test updating a scholarship that doesn't exist returns 404"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         update_data = {"title": "Updated Title"}
         
-        response = await client.patch(
+        response = await admin_client.patch(
             "/api/v1/admin/scholarships/999999",
-            json=update_data,
-            headers=headers
+            json=update_data
         )
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert "not found" in response.json()["detail"].lower()
 
-    async def test_delete_scholarship(self, client, admin_token):
+    async def test_delete_scholarship(self, admin_client, make_scholarship, db_session):
         """Test deleting a scholarship"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create scholarship
-        create_data = {
-            "title": "To Be Deleted",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
-        }
-        
-        create_response = await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
-        scholarship_id = create_response.json()["id"]
+        scholarship = await make_scholarship(title="To Be Deleted")
+        scholarship_id = scholarship.id
         
         # Delete it
-        response = await client.delete(
-            f"/api/v1/admin/scholarships/{scholarship_id}",
-            headers=headers
+        response = await admin_client.delete(
+            f"/api/v1/admin/scholarships/{scholarship_id}"
         )
         
         assert response.status_code == status.HTTP_204_NO_CONTENT
         
         # Verify it's gone
-        get_response = await client.get(f"/api/v1/scholarships/{scholarship_id}")
-        assert get_response.status_code == status.HTTP_404_NOT_FOUND
+        assert await db_session.get(Scholarship, scholarship_id) is None
 
-    async def test_delete_nonexistent_scholarship(self, client, admin_token):
+    async def test_delete_nonexistent_scholarship(self, admin_client):
         """Test deleting a non-existent scholarship returns 404"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        response = await client.delete(
-            "/api/v1/admin/scholarships/999999",
-            headers=headers
+        response = await admin_client.delete(
+            "/api/v1/admin/scholarships/999999"
         )
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -239,182 +200,60 @@ class TestScholarshipCRUD:
 class TestScholarshipVerificationAndFeaturing:
     """Test verification and featuring functionality"""
 
-    async def test_verify_scholarship(self, client, admin_token):
-        """Test marking a scholarship as verified"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        # Create scholarship
-        create_data = {
-            "title": "Unverified Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
-            "verified": False
-        }
-        
-        create_response = await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
-        scholarship_id = create_response.json()["id"]
-        
-        # Verify it
-        verify_data = {"verified": True}
-        
-        response = await client.patch(
-            f"/api/v1/admin/scholarships/{scholarship_id}/verify",
-            json=verify_data,
-            headers=headers
-        )
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["verified"] is True
-
-    async def test_unverify_scholarship(self, client, admin_token):
-        """Test removing verification from a scholarship"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        # Create verified scholarship
-        create_data = {
-            "title": "Verified Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
-            "verified": True
-        }
-        
-        create_response = await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
-        scholarship_id = create_response.json()["id"]
-        
-        # Unverify it
-        verify_data = {"verified": False}
-        
-        response = await client.patch(
-            f"/api/v1/admin/scholarships/{scholarship_id}/verify",
-            json=verify_data,
-            headers=headers
+    @pytest.mark.parametrize(
+        "action,field,initial,new",
+        [
+            ("verify", "verified", False, True),
+            ("verify", "verified", True, False),
+            ("feature", "featured", False, True),
+            ("feature", "featured", True, False),
+        ],
+        ids=["verify", "unverify", "feature", "unfeature"],
+    )
+    async def test_admin_patch_field(
+        self, admin_client, make_scholarship, action, field, initial, new
+    ):
+        """Test setting and clearing the verified and featured flags"""
+        scholarship = await make_scholarship(**{field: initial})
+        
+        response = await admin_client.patch(
+            f"/api/v1/admin/scholarships/{scholarship.id}/{action}",
+            json={field: new}
         )
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
-        assert data["verified"] is False
+        assert data[field] is new
 
-    async def test_verify_nonexistent_scholarship(self, client, admin_token):
+    async def test_verify_nonexistent_scholarship(self, admin_client):
         """Test verifying a non-existent scholarship returns 404"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         verify_data = {"verified": True}
         
-        response = await client.patch(
+        response = await admin_client.patch(
             "/api/v1/admin/scholarships/999999/verify",
-            json=verify_data,
-            headers=headers
+            json=verify_data
         )
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    async def test_feature_scholarship(self, client, admin_token):
-        """Test marking a scholarship as featured"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        # Create scholarship
-        create_data = {
-            "title": "Regular Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
-            "featured": False
-        }
-        
-        create_response = await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
-        scholarship_id = create_response.json()["id"]
-        
-        # Feature it
-        feature_data = {"featured": True}
-        
-        response = await client.patch(
-            f"/api/v1/admin/scholarships/{scholarship_id}/feature",
-            json=feature_data,
-            headers=headers
-        )
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["featured"] is True
-
-    async def test_unfeature_scholarship(self, client, admin_token):
-        """Test removing featured status from a scholarship"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        # Create featured scholarship
-        create_data = {
-            "title": "Featured Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
-            "featured": True
-        }
-        
-        create_response = await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
-        scholarship_id = create_response.json()["id"]
-        
-        # Unfeature it
-        feature_data = {"featured": False}
-        
-        response = await client.patch(
-            f"/api/v1/admin/scholarships/{scholarship_id}/feature",
-            json=feature_data,
-            headers=headers
-        )
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["featured"] is False
-
 
 class TestBulkOperations:
     """Test bulk status update operations"""
 
-    async def test_bulk_status_update(self, client, admin_token):
+    async def test_bulk_status_update(self, admin_client, db_session):
         """Test updating status for multiple scholarships at once"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        # Create multiple scholarships
-        scholarship_ids = []
-        for i in range(3):
-            create_data = {
-                "title": f"Bulk Test Scholarship {i}",
-                "organization": "Test Org",
-                "scholarship_type": "STEM",
-                "amount_min": 1000,
-                "amount_max": 2000,
-                "status": "ACTIVE"
-            }
-            
-            create_response = await client.post(
-                "/api/v1/admin/scholarships",
-                json=create_data,
-                headers=headers
+        # Create multiple scholarships with one INSERT
+        scholarships = [
+            Scholarship(
+                **BASE_SCHOLARSHIP,
+                title=f"Bulk Test Scholarship {i}",
+                status="ACTIVE"
             )
-            scholarship_ids.append(create_response.json()["id"])
+            for i in range(3)
+        ]
+        db_session.add_all(scholarships)
+        await db_session.flush()
+        scholarship_ids = [scholarship.id for scholarship in scholarships]
         
         # Bulk update to EXPIRED
         bulk_data = {
@@ -422,10 +261,9 @@ class TestBulkOperations:
             "status": "EXPIRED"
         }
         
-        response = await client.post(
+        response = await admin_client.post(
             "/api/v1/admin/scholarships/bulk-status-update",
-            json=bulk_data,
-            headers=headers
+            json=bulk_data
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -435,55 +273,47 @@ class TestBulkOperations:
         assert data["new_status"] == "EXPIRED"
         assert len(data["scholarship_ids"]) == 3
 
-    async def test_bulk_update_invalid_status(self, client, admin_token):
+    async def test_bulk_update_invalid_status(self, admin_client):
         """Test bulk update with invalid status fails"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         bulk_data = {
             "scholarship_ids": [1, 2, 3],
             "status": "INVALID_STATUS"
         }
         
-        response = await client.post(
+        response = await admin_client.post(
             "/api/v1/admin/scholarships/bulk-status-update",
-            json=bulk_data,
-            headers=headers
+            json=bulk_data
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "must be one of" in response.json()["detail"]
 
-    async def test_bulk_update_too_many_scholarships(self, client, admin_token):
+    async def test_bulk_update_too_many_scholarships(self, admin_client):
         """Test that bulk updating more than 100 scholarships fails"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Try to update 101 scholarships
         bulk_data = {
             "scholarship_ids": list(range(1, 102)),  # 101 IDs
             "status": "INACTIVE"
         }
         
-        response = await client.post(
+        response = await admin_client.post(
             "/api/v1/admin/scholarships/bulk-status-update",
-            json=bulk_data,
-            headers=headers
+            json=bulk_data
         )
         
+        # Response has validation error for exceeding max items
         assert response.status_code == 422
 
-        assert response.status_code == 422
-        # Response has validation error for exceeding max items
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
+    async def test_bulk_update_nonexistent_ids(self, admin_client):
+        """Test bulk update with IDs that don't exist returns 404"""
         bulk_data = {
             "scholarship_ids": [999998, 999999],
             "status": "INACTIVE"
         }
         
-        response = await client.post(
+        response = await admin_client.post(
             "/api/v1/admin/scholarships/bulk-status-update",
-            json=bulk_data,
-            headers=headers
+            json=bulk_data
         )
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -492,21 +322,18 @@ class TestBulkOperations:
 class TestAdminDashboard:
     """Test admin dashboard and statistics endpoints"""
 
-    async def test_get_scholarship_statistics(self, client, admin_token):
+    async def test_get_scholarship_statistics(self, admin_client, bulk_seed_scholarships):
         """Test getting scholarship statistics for admin dashboard"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        # Create a few scholarships with different properties
+        # Create a few scholarships with different properties (one COPY)
         scholarships_data = [
             {
+                **BASE_SCHOLARSHIP,
                 "title": "Active Verified STEM",
-                "organization": "Test Org",
-                "scholarship_type": "STEM",
                 "amount_min": 5000,
                 "amount_max": 10000,
                 "status": "ACTIVE",
                 "verified": True,
-                "featured": True
+                "featured": True,
             },
             {
                 "title": "Active Unverified Arts",
@@ -519,28 +346,19 @@ class TestAdminDashboard:
                 "featured": False
             },
             {
+                **BASE_SCHOLARSHIP,
                 "title": "Inactive Scholarship",
-                "organization": "Test Org",
-                "scholarship_type": "STEM",
-                "amount_min": 1000,
-                "amount_max": 2000,
                 "status": "INACTIVE",
                 "verified": False,
-                "featured": False
+                "featured": False,
             }
         ]
         
-        for scholarship_data in scholarships_data:
-            await client.post(
-                "/api/v1/admin/scholarships",
-                json=scholarship_data,
-                headers=headers
-            )
+        await bulk_seed_scholarships(scholarships_data)
         
         # Get statistics
-        response = await client.get(
-            "/api/v1/admin/scholarships/stats/overview",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/stats/overview"
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -557,30 +375,23 @@ class TestAdminDashboard:
         assert "by_type" in data
         assert isinstance(data["by_type"], list)
 
-    async def test_get_scholarships_needing_review(self, client, admin_token):
+    async def test_get_scholarships_needing_review(self, admin_client):
         """Test getting scholarships that need admin review"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create an unverified scholarship
         create_data = {
+            **BASE_SCHOLARSHIP,
             "title": "Needs Review",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
-            "verified": False
+            "verified": False,
         }
         
-        await client.post(
+        await admin_client.post(
             "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
+            json=create_data
         )
         
         # Get unverified scholarships
-        response = await client.get(
-            "/api/v1/admin/scholarships/needs-review?verified=false",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/needs-review?verified=false"
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -591,32 +402,23 @@ class TestAdminDashboard:
         assert "scholarships" in data
         assert isinstance(data["scholarships"], list)
 
-    async def test_get_expired_scholarships(self, client, admin_token):
+    async def test_get_expired_scholarships(self, admin_client):
         """Test getting expired scholarships"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create an expired scholarship
-        past_date = (date.today() - timedelta(days=30)).isoformat()
-        
         create_data = {
+            **BASE_SCHOLARSHIP,
             "title": "Expired Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
-            "deadline": past_date
+            "deadline": PAST_DATE_30D,
         }
         
-        await client.post(
+        await admin_client.post(
             "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
+            json=create_data
         )
         
         # Get expired scholarships
-        response = await client.get(
-            "/api/v1/admin/scholarships/needs-review?expired=true",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/needs-review?expired=true"
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -625,29 +427,22 @@ class TestAdminDashboard:
         assert data["filters"]["expired"] is True
         assert "scholarships" in data
 
-    async def test_get_recent_scholarships(self, client, admin_token):
+    async def test_get_recent_scholarships(self, admin_client):
         """Test getting recently created or updated scholarships"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create a scholarship
         create_data = {
+            **BASE_SCHOLARSHIP,
             "title": "Recent Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
-            "amount_min": 1000,
-            "amount_max": 2000,
         }
         
-        await client.post(
+        await admin_client.post(
             "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
+            json=create_data
         )
         
         # Get recent scholarships (last 7 days by default)
-        response = await client.get(
-            "/api/v1/admin/scholarships/recent",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/recent"
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -658,13 +453,10 @@ class TestAdminDashboard:
         assert "scholarships" in data
         assert isinstance(data["scholarships"], list)
 
-    async def test_get_recent_scholarships_custom_days(self, client, admin_token):
+    async def test_get_recent_scholarships_custom_days(self, admin_client):
         """Test getting recent scholarships with custom lookback period"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        response = await client.get(
-            "/api/v1/admin/scholarships/recent?days=30&limit=50",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/recent?days=30&limit=50"
         )
         
         assert response.status_code == status.HTTP_200_OK
@@ -676,10 +468,8 @@ class TestAdminDashboard:
 class TestAdminSearch:
     """Test advanced admin search functionality"""
 
-    async def test_admin_search_scholarships(self, client, admin_token):
+    async def test_admin_search_scholarships(self, admin_client, bulk_seed_scholarships):
         """Test basic admin scholarship search"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create a searchable scholarship
         create_data = {
             "title": "Searchable STEM Award",
@@ -689,90 +479,66 @@ class TestAdminSearch:
             "amount_max": 10000,
         }
         
-        await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
+        await bulk_seed_scholarships([create_data])
         
         # Search for it
-        response = await client.get(
-            "/api/v1/admin/scholarships/search?query_text=Searchable",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/search?query_text=Searchable"
         )
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
 
-    async def test_admin_search_with_filters(self, client, admin_token):
+    async def test_admin_search_with_filters(self, admin_client, bulk_seed_scholarships):
         """Test admin search with multiple filters"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create scholarships with different attributes
         create_data = {
+            **BASE_SCHOLARSHIP,
             "title": "STEM Verified Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
             "amount_min": 5000,
             "amount_max": 10000,
             "verified": True,
             "featured": True,
-            "status": "ACTIVE"
+            "status": "ACTIVE",
         }
         
-        await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
+        await bulk_seed_scholarships([create_data])
         
         # Search with filters
-        response = await client.get(
-            "/api/v1/admin/scholarships/search?scholarship_type=STEM&verified=true&featured=true",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/search?scholarship_type=STEM&verified=true&featured=true"
         )
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
 
-    async def test_admin_search_by_amount_range(self, client, admin_token):
+    async def test_admin_search_by_amount_range(self, admin_client, bulk_seed_scholarships):
         """Test searching scholarships by amount range"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
         # Create scholarship in specific amount range
         create_data = {
+            **BASE_SCHOLARSHIP,
             "title": "Medium Amount Scholarship",
-            "organization": "Test Org",
-            "scholarship_type": "STEM",
             "amount_min": 5000,
             "amount_max": 7500,
         }
         
-        await client.post(
-            "/api/v1/admin/scholarships",
-            json=create_data,
-            headers=headers
-        )
+        await bulk_seed_scholarships([create_data])
         
         # Search for scholarships in amount range
-        response = await client.get(
-            "/api/v1/admin/scholarships/search?min_amount=4000&max_amount=8000",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/search?min_amount=4000&max_amount=8000"
         )
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
 
-    async def test_admin_search_pagination(self, client, admin_token):
+    async def test_admin_search_pagination(self, admin_client):
         """Test search with pagination parameters"""
-        headers = {"Authorization": f"Bearer {admin_token}"}
-        
-        response = await client.get(
-            "/api/v1/admin/scholarships/search?limit=10&offset=0",
-            headers=headers
+        response = await admin_client.get(
+            "/api/v1/admin/scholarships/search?limit=10&offset=0"
         )
         
         assert response.status_code == status.HTTP_200_OK
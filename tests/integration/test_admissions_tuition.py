@@ -12,14 +12,10 @@ class TestAdmissionsData:
     @pytest.mark.asyncio
     async def test_get_admissions_data(
         self,
-        client: AsyncClient,
-        admin_headers: dict
+        admin_client: AsyncClient
     ):
         """Test getting admissions data for admin's institution"""
-        response = await client.get(
-            "/api/v1/admin/data/admissions",
-            headers=admin_headers
-        )
+        response = await admin_client.get("/api/v1/admin/data/admissions")
         
         # May return empty list or data
         assert response.status_code == 200
@@ -30,15 +26,46 @@ class TestAdmissionsData:
     async def test_get_public_admissions_data(
         self,
         client: AsyncClient,
-        test_institution
+        test_institution,
+        seeded_admission
     ):
         """Test getting public admissions data"""
         response = await client.get(
             f"/api/v1/institutions/{test_institution.ipeds_id}/admissions"
         )
         
-        # May return 404 if no data exists
-        assert response.status_code in [200, 404]
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_update_admissions_data(
+        self,
+        admin_client: AsyncClient,
+        seeded_admission
+    ):
+        """Test admin updating their admissions data"""
+        response = await admin_client.put(
+            f"/api/v1/admin/data/admissions/{seeded_admission.id}",
+            json={"acceptance_rate": 15.5}
+        )
+        
+        assert response.status_code == 200
+        assert float(response.json()["acceptance_rate"]) == 15.5
+    
+    @pytest.mark.asyncio
+    async def test_verify_admissions_data(
+        self,
+        admin_client: AsyncClient,
+        seeded_admission,
+        db_session
+    ):
+        """Test admin marking their admissions data as verified"""
+        response = await admin_client.post(
+            f"/api/v1/admin/data/admissions/{seeded_admission.id}/verify"
+        )
+        
+        assert response.status_code == 200
+        await db_session.refresh(seeded_admission)
+        assert seeded_admission.is_admin_verified is True
 
 
 @pytest.mark.integration
@@ -48,14 +75,10 @@ class TestTuitionData:
     @pytest.mark.asyncio
     async def test_get_tuition_data(
         self,
-        client: AsyncClient,
-        admin_headers: dict
+        admin_client: AsyncClient
     ):
         """Test getting tuition data for admin's institution"""
-        response = await client.get(
-            "/api/v1/admin/data/tuition",
-            headers=admin_headers
-        )
+        response = await admin_client.get("/api/v1/admin/data/tuition")
         
         assert response.status_code == 200
         data = response.json()
@@ -65,24 +88,58 @@ class TestTuitionData:
     async def test_get_public_tuition_data(
         self,
         client: AsyncClient,
-        test_institution
+        test_institution,
+        seeded_tuition
     ):
         """Test getting public tuition data"""
         response = await client.get(
             f"/api/v1/institutions/{test_institution.ipeds_id}/tuition"
         )
         
-        assert response.status_code in [200, 404]
+        assert response.status_code == 200
     
     @pytest.mark.asyncio
     async def test_get_financial_overview(
         self,
         client: AsyncClient,
-        test_institution
+        test_institution,
+        seeded_tuition,
+        seeded_admission
     ):
         """Test getting financial overview"""
         response = await client.get(
             f"/api/v1/institutions/{test_institution.ipeds_id}/financial-overview"
         )
         
-        assert response.status_code in [200, 404]
+        assert response.status_code == 200
+    
+    @pytest.mark.asyncio
+    async def test_update_tuition_data(
+        self,
+        admin_client: AsyncClient,
+        seeded_tuition
+    ):
+        """Test admin updating their tuition data"""
+        response = await admin_client.put(
+            f"/api/v1/admin/data/tuition/{seeded_tuition.id}",
+            json={"tuition_in_state": 12000}
+        )
+        
+        assert response.status_code == 200
+        assert float(response.json()["tuition_in_state"]) == 12000
+    
+    @pytest.mark.asyncio
+    async def test_verify_tuition_data(
+        self,
+        admin_client: AsyncClient,
+        seeded_tuition,
+        db_session
+    ):
+        """Test admin marking their tuition data as verified"""
+        response = await admin_client.post(
+            f"/api/v1/admin/data/tuition/{seeded_tuition.id}/verify"
+        )
+        
+        assert response.status_code == 200
+        await db_session.refresh(seeded_tuition)
+        assert seeded_tuition.is_admin_verified is True
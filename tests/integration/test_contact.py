@@ -2,48 +2,76 @@
 Integration tests for contact form and inquiry management
 """
 
+from types import MappingProxyType
+
 import pytest
 from httpx import AsyncClient
 
+# Submission payloads, read-only so no test can change them for the others;
+# entity_id is filled in from test_institution
+FULL_PAYLOAD = MappingProxyType(
+    {
+        "name": "Test User",
+        "email": "test@example.com",
+        "message": "Test inquiry",
+        "entity_type": "institution",
+        "institution_name": "Test University",
+        "inquiry_type": "OTHER",
+    }
+)
+GENERAL_INQUIRY = MappingProxyType({**FULL_PAYLOAD, "inquiry_type": "general"})
+MISSING_FIELDS = MappingProxyType(
+    {
+        "name": "John Doe"
+        # Missing email, institution_name, subject, message
+    }
+)
+SUPPORT_INQUIRY = MappingProxyType(
+    {
+        "name": "Test User",
+        "email": "test@example.com",
+        "institution_name": "Test Institution",
+        "subject": "Test Inquiry",
+        "message": "This is a test message",
+        "inquiry_type": "OTHER",
+    }
+)
+
 
 @pytest.mark.integration
 class TestContactForm:
     """Test public contact form submission"""
 
     @pytest.mark.asyncio
-    async def test_submit_contact_form(
-        self, client: AsyncClient, test_institution  # ADD THIS
+    @pytest.mark.parametrize(
+        "payload,needs_entity_id,check_body,expected",
+        [
+            (FULL_PAYLOAD, True, True, {200, 201, 500}),
+            (GENERAL_INQUIRY, True, False, {200, 201, 400, 422, 500}),
+            (MISSING_FIELDS, False, False, {422}),
+        ],
+        ids=["full", "general_inquiry", "missing_fields"],
+    )
+    async def test_contact_submit(
+        self,
+        client: AsyncClient,
+        test_institution,
+        payload,
+        needs_entity_id,
+        check_body,
+        expected,
     ):
-        """Test submitting a contact form"""
-        response = await client.post(
-            "/api/v1/contact/submit",
-            json={
-                "name": "Test User",
-                "email": "test@example.com",
-                "message": "Test inquiry",
-                "entity_id": test_institution.id,
-                "entity_type": "institution",
-                "institution_name": "Test University",
-                "inquiry_type": "OTHER",
-            },
-        )
-        assert response.status_code in [200, 201, 500]
-        data = response.json()
-        assert "message" in data or "id" in data
-
-    @pytest.mark.asyncio
-    async def test_submit_contact_form_validation(self, client: AsyncClient):
-        """Test contact form validation"""
-        # Missing required fields
-        invalid_data = {
-            "name": "John Doe"
-            # Missing email, institution_name, subject, message
-        }
+        """Test submitting a contact form, including validation failures"""
+        body = dict(payload)
+        if needs_entity_id:
+            body["entity_id"] = test_institution.id
 
-        response = await client.post("/api/v1/contact/submit", json=invalid_data)
+        response = await client.post("/api/v1/contact/submit", json=body)
 
-        # Should fail validation
-        assert response.status_code == 422
+        assert response.status_code in expected
+        if check_body:
+            data = response.json()
+            assert "message" in data or "id" in data
 
 
 @pytest.mark.integration
@@ -69,36 +97,45 @@ class TestInquiryManagement:
     ):
         """Test getting a specific inquiry"""
         # First submit a contact form
-        contact_data = {
-            "name": "Test User",
-            "email": "test@example.com",
-            "institution_name": "Test Institution",
-            "subject": "Test Inquiry",
-            "message": "This is a test message",
-            "inquiry_type": "support",
-        }
-
-        submit_response = await client.post("/api/v1/contact/submit", json=contact_data)
-
-        if submit_response.status_code in [200, 201]:
-            # Try to get all inquiries
-            list_response = await client.get(
-                "/api/v1/contact/inquiries", headers=super_admin_headers
-            )
-
-            if list_response.status_code == 200:
-                inquiries = list_response.json()
-
-                # If there are inquiries, try to get one
-                if isinstance(inquiries, list) and len(inquiries) > 0:
-                    inquiry_id = inquiries[0].get("id")
-
-                    if inquiry_id:
-                        detail_response = await client.get(
-                            f"/api/v1/contact/inquiries/{inquiry_id}",
-                            headers=super_admin_headers,
-                        )
-
-                        assert detail_response.status_code == 200
-                        data = detail_response.json()
-                        assert "email" in data or "message" in data
+        submit_response = await client.post(
+            "/api/v1/contact/submit", json=dict(SUPPORT_INQUIRY)
+        )
+
+        if submit_response.status_code not in [200, 201]:
+            pytest.skip("submit endpoint unavailable")
+
+        # Get all inquiries and pick one
+        list_response = await client.get(
+            "/api/v1/contact/inquiries", headers=super_admin_headers
+        )
+        if list_response.status_code != 200:
+            pytest.skip("inquiry list unavailable")
+
+        inquiries = list_response.json()
+        if not isinstance(inquiries, list) or not inquiries:
+            pytest.skip("no inquiries listed")
+
+        inquiry_id = inquiries[0].get("id")
+        if not inquiry_id:
+            pytest.skip("listed inquiry has no id")
+
+        detail_response = await client.get(
+            f"/api/v1/contact/inquiries/{inquiry_id}",
+            headers=super_admin_headers,
+        )
+
+        assert detail_response.status_code == 200
+        data = detail_response.json()
+        assert "email" in data or "message" in data
+
+    @pytest.mark.asyncio
+    async def test_get_inquiries_without_auth(self, client: AsyncClient):
+        """Test /api/v1/contact/inquiries without credentials"""
+        response = await client.get("/api/v1/contact/inquiries")
+        assert response.status_code in [200, 404]
+
+    @pytest.mark.asyncio
+    async def test_get_inquiry_by_id_without_auth(self, client: AsyncClient):
+        """Test /api/v1/contact/inquiries/{inquiry_id} without credentials"""
+        response = await client.get("/api/v1/contact/inquiries/1")
+        assert response.status_code in [200, 404]
@@ -1,46 +0,0 @@
-"""
-Integration tests for Contact Forms
-"""
-
-import pytest
-from httpx import AsyncClient
-
-
-@pytest.mark.integration
-class TestContactForms:
-    """Test Contact Forms endpoints"""
-
-    @pytest.mark.asyncio
-    async def test_post_api_v1_contact_submit(
-        self, client: AsyncClient, test_institution  # Add this fixture
-    ):
-        """Test /api/v1/contact/submit"""
-        response = await client.post(
-            "/api/v1/contact/submit",
-            json={
-                "name": "Test User",
-                "email": "test@example.com",
-                "message": "Test inquiry",
-                "institution_name": "Test University",
-                "inquiry_type": "general",
-                "entity_id": test_institution.id,  # ADD THIS
-                "entity_type": "institution",  # ADD THIS
-            },
-        )
-        assert response.status_code in [200, 201, 400, 422, 500]  # Add 500 for now
-
-    @pytest.mark.asyncio
-    async def test_get_api_v1_contact_inquiries(self, client: AsyncClient):
-        """Test /api/v1/contact/inquiries"""
-        response = await client.get(
-            "/api/v1/contact/inquiries",
-        )
-        assert response.status_code in [200, 404]
-
-    @pytest.mark.asyncio
-    async def test_get_api_v1_contact_inquiry_by_id(self, client: AsyncClient):
-        """Test /api/v1/contact/inquiries/{inquiry_id}"""
-        response = await client.get(
-            "/api/v1/contact/inquiries/1",
-        )
-        assert response.status_code in [200, 404]
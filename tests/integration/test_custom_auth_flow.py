@@ -30,18 +30,11 @@ class TestSuperAdminFlow:
     @pytest.mark.asyncio
     async def test_super_admin_get_info(
         self,
-        client: AsyncClient,
-        super_admin_headers: dict,
+        super_admin_me: dict,
         super_admin_user
     ):
         """Test Super Admin can access /auth/me"""
-        response = await client.get(
-            "/api/v1/admin/auth/me",
-            headers=super_admin_headers
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
+        data = super_admin_me
         assert data["email"] == super_admin_user.email  # Use dynamic email
         assert data["role"] == "super_admin"
         assert data["entity_type"] is None
@@ -87,7 +80,7 @@ class TestInvitationFlow:
         self,
         client: AsyncClient,
         super_admin_headers: dict,
-        invitation_code_institution
+        invitation_code_institution_claimed
     ):
         """Test Super Admin can list all invitations"""
         response = await client.get(
@@ -104,12 +97,12 @@ class TestInvitationFlow:
     async def test_validate_invitation_code(
         self,
         client: AsyncClient,
-        invitation_code_institution
+        invitation_code_institution_fresh
     ):
         """Test public invitation validation (no auth required)"""
         response = await client.post(
             "/api/v1/admin/auth/validate-invitation",
-            json={"code": invitation_code_institution.code}
+            json={"code": invitation_code_institution_fresh.code}
         )
         
         assert response.status_code == 200
@@ -141,11 +134,11 @@ class TestAdminRegistrationAndLogin:
     async def test_complete_registration_flow(
         self,
         client: AsyncClient,
-        invitation_code_institution,
+        invitation_code_institution_fresh,
         db_session
     ):
         """Test complete registration flow with invitation code"""
-        email = invitation_code_institution.assigned_email
+        email = invitation_code_institution_fresh.assigned_email
         password = "TestPassword123!"
         
         # 1. Register with invitation code
@@ -154,7 +147,7 @@ class TestAdminRegistrationAndLogin:
             json={
                 "email": email,
                 "password": password,
-                "invitation_code": invitation_code_institution.code
+                "invitation_code": invitation_code_institution_fresh.code
             }
         )
         
@@ -184,15 +177,14 @@ class TestAdminRegistrationAndLogin:
         assert me_data["email"] == email
         
         # 4. Verify invitation code is now CLAIMED
-        await db_session.refresh(invitation_code_institution)
-        assert invitation_code_institution.status == InvitationStatus.CLAIMED
+        await db_session.refresh(invitation_code_institution_fresh)
+        assert invitation_code_institution_fresh.status == InvitationStatus.CLAIMED
     
     @pytest.mark.asyncio
     async def test_cannot_reuse_claimed_invitation(
         self,
         client: AsyncClient,
-        registered_admin_user,
-        invitation_code_institution
+        admin_session
     ):
         """Test that claimed invitation codes cannot be reused"""
         response = await client.post(
@@ -200,7 +192,7 @@ class TestAdminRegistrationAndLogin:
             json={
                 "email": "another@test.com",
                 "password": "TestPassword123!",
-                "invitation_code": invitation_code_institution.code
+                "invitation_code": admin_session.invitation.code
             }
         )
         
@@ -211,13 +203,13 @@ class TestAdminRegistrationAndLogin:
     async def test_login_with_wrong_password(
         self,
         client: AsyncClient,
-        registered_admin_user
+        admin_session
     ):
         """Test login fails with incorrect password"""
         response = await client.post(
             "/api/v1/admin/auth/login",
             data={
-                "username": registered_admin_user["email"],
+                "username": admin_session.email,
                 "password": "WrongPassword123!"
             }
         )
@@ -231,21 +223,9 @@ class TestAdminEntityAccess:
     """Test admin users can access their entities"""
     
     @pytest.mark.asyncio
-    async def test_admin_can_access_entity(
-        self,
-        client: AsyncClient,
-        admin_headers: dict,
-        test_institution
-    ):
+    async def test_admin_can_access_entity(self, admin_entity: dict):
         """Test admin user can access their institution/scholarship"""
-        response = await client.get(
-            "/api/v1/admin/profile/entity",
-            headers=admin_headers
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "name" in data  # Institution/Scholarship name
+        assert "name" in admin_entity  # Institution/Scholarship name
     
     @pytest.mark.asyncio
     async def test_admin_can_get_display_settings(
@@ -5,7 +5,15 @@ Integration tests for gallery management
 import pytest
 from httpx import AsyncClient
 import io
-from PIL import Image
+
+# 1x1 grayscale JPEG (160 bytes); the upload route only checks type and size
+MINIMAL_JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb00430008060607060508"
+    "0707070909080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720"
+    "222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001"
+    "000101011100ffc40014000100000000000000000000000000000008ffc40014"
+    "100100000000000000000000000000000000ffda0008010100003f003fbfffd9"
+)
 
 
 @pytest.mark.integration
@@ -23,15 +31,10 @@ class TestGalleryEndpoints:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
+    @pytest.mark.spaces
     async def test_upload_gallery_image(self, client: AsyncClient, admin_headers: dict):
         """Test uploading an image to gallery"""
-        # Create a test image in memory
-        img = Image.new("RGB", (100, 100), color="red")
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="JPEG")
-        img_bytes.seek(0)
-
-        files = {"file": ("test.jpg", img_bytes, "image/jpeg")}
+        files = {"file": ("test.jpg", io.BytesIO(MINIMAL_JPEG), "image/jpeg")}
         data = {"caption": "Test Image", "image_type": "campus"}
 
         response = await client.post(
@@ -1,72 +1,19 @@
 # tests/integration/test_gallery_complete.py
 """
 Complete gallery and image management tests
+
+Gallery image route smoke checks live in test_route_smoke.py.
 """
 import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.integration
-class TestGalleryImageManagement:
-    """Test individual gallery image operations"""
-
-    @pytest.mark.asyncio
-    async def test_update_gallery_image(self, client: AsyncClient, admin_headers: dict):
-        """Test updating gallery image metadata"""
-        # This assumes an image exists with ID 1
-        update_data = {
-            "caption": "Updated caption",
-            "image_type": "campus",
-            "display_order": 1,
-        }
-
-        response = await client.put(
-            "/api/v1/admin/gallery/1", headers=admin_headers, json=update_data
-        )
-
-        # May fail if image doesn't exist
-        assert response.status_code in [200, 404]
-
-    @pytest.mark.asyncio
-    async def test_delete_gallery_image(self, client: AsyncClient, admin_headers: dict):
-        """Test deleting a gallery image"""
-        response = await client.delete(
-            "/api/v1/admin/gallery/999", headers=admin_headers  # Non-existent ID
-        )
-
-        # Should return 404 for non-existent
-        assert response.status_code in [200, 404]
-
-    @pytest.mark.asyncio
-    async def test_set_featured_image(self, client: AsyncClient, admin_headers: dict):
-        """Test setting featured image"""
-        featured_data = {"image_id": 1}
-
-        response = await client.post(
-            "/api/v1/admin/gallery/set-featured",
-            headers=admin_headers,
-            json=featured_data,
-        )
-
-        # May fail if image doesn't exist
-        assert response.status_code in [200, 404]
-
-    @pytest.mark.asyncio
-    async def test_get_featured_image(self, client: AsyncClient, admin_headers: dict):
-        """Test getting featured image"""
-        response = await client.get(
-            "/api/v1/admin/gallery/featured", headers=admin_headers
-        )
-
-        # Returns 404 if no featured image set
-        assert response.status_code in [200, 404]
-
-
 @pytest.mark.integration
 class TestImageListAndDelete:
     """Test image listing and deletion"""
 
     @pytest.mark.asyncio
+    @pytest.mark.spaces
     async def test_list_images(self, client: AsyncClient, admin_headers: dict):
         """Test listing uploaded images"""
         response = await client.get("/api/v1/admin/images/list", headers=admin_headers)
@@ -80,6 +27,7 @@ class TestImageListAndDelete:
             assert "images" in data or isinstance(data, list)
 
     @pytest.mark.asyncio
+    @pytest.mark.spaces
     async def test_delete_image(self, client: AsyncClient, admin_headers: dict):
         """Test deleting an uploaded image"""
         # Try to delete a non-existent file
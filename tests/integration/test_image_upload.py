@@ -4,8 +4,6 @@ Integration tests for image upload and gallery management
 """
 import pytest
 from httpx import AsyncClient
-import io
-from PIL import Image
 
 
 @pytest.mark.integration
@@ -15,6 +13,7 @@ class TestImageUpload:
     """Test image upload to DigitalOcean Spaces"""
 
     @pytest.mark.asyncio
+    @pytest.mark.spaces
     async def test_upload_image_to_spaces(
         self, client: AsyncClient, admin_headers: dict, sample_image_bytes: bytes
     ):
@@ -64,6 +63,7 @@ class TestGalleryManagement:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
+    @pytest.mark.spaces
     async def test_add_gallery_image(
         self, client: AsyncClient, admin_headers: dict, sample_image_bytes: bytes
     ):
@@ -14,11 +14,11 @@ class TestInvitationDeletion:
         self,
         client: AsyncClient,
         super_admin_headers: dict,
-        invitation_code_institution
+        invitation_code_institution_fresh
     ):
         """Test Super Admin can delete invitation codes"""
         response = await client.delete(
-            f"/api/v1/admin/auth/invitations/{invitation_code_institution.id}",
+            f"/api/v1/admin/auth/invitations/{invitation_code_institution_fresh.id}",
             headers=super_admin_headers
         )
         
@@ -28,33 +28,52 @@ class TestProfileEndpoints:
         assert data["id"] == test_institution.id
     
     @pytest.mark.asyncio
-    async def test_get_display_settings_not_found(
+    async def test_get_display_settings_creates_defaults(
         self,
         client: AsyncClient,
-        admin_headers: dict
+        admin_headers: dict,
+        test_institution
     ):
-        """Test getting display settings when none exist"""
+        """Test getting display settings when none exist creates the defaults"""
         response = await client.get(
             "/api/v1/admin/profile/display-settings",
             headers=admin_headers
         )
         
-        # May return 404 or empty data
-        assert response.status_code in [200, 404]
+        assert response.status_code == 200
+        data = response.json()
+        assert data["entity_id"] == test_institution.id
+        assert data["show_stats"] is True
+        assert data["show_video"] is False
+        assert data["layout_style"] == "standard"
     
     @pytest.mark.asyncio
-    async def test_create_and_update_display_settings(
+    async def test_update_display_settings_not_found(
         self,
         client: AsyncClient,
         admin_headers: dict
     ):
-        """Test creating and updating display settings"""
-        # Create/Update display settings
+        """Test updating display settings before they exist"""
+        response = await client.put(
+            "/api/v1/admin/profile/display-settings",
+            headers=admin_headers,
+            json={"show_video": True}
+        )
+        
+        assert response.status_code == 404
+    
+    @pytest.mark.asyncio
+    async def test_update_display_settings(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        seeded_display_settings
+    ):
+        """Test updating existing display settings"""
         settings_data = {
-            "show_admissions_data": True,
-            "show_tuition_data": True,
-            "show_financial_overview": False,
-            "featured_stats": ["acceptance_rate", "avg_sat"]
+            "show_financial": False,
+            "show_video": True,
+            "custom_tagline": "Learn by doing"
         }
         
         response = await client.put(
@@ -63,16 +82,18 @@ class TestProfileEndpoints:
             json=settings_data
         )
         
-        # May not be implemented yet
-        assert response.status_code in [200, 201, 404, 501]
+        assert response.status_code == 200
+        assert response.json()["id"] == seeded_display_settings.id
+        
+        # Get settings to verify
+        get_response = await client.get(
+            "/api/v1/admin/profile/display-settings",
+            headers=admin_headers
+        )
         
-        if response.status_code in [200, 201]:
-            # Get settings to verify
-            get_response = await client.get(
-                "/api/v1/admin/profile/display-settings",
-                headers=admin_headers
-            )
-            
-            assert get_response.status_code == 200
-            data = get_response.json()
-            assert data["show_admissions_data"] == True
+        assert get_response.status_code == 200
+        data = get_response.json()
+        assert data["show_financial"] is False
+        assert data["show_video"] is True
+        assert data["custom_tagline"] == "Learn by doing"
+        assert data["show_stats"] is True